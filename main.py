@@ -1,11 +1,12 @@
 from renpydux import ActionReducerMapBuilder, RenpyduxState, createReducer, RenpyduxStore, ActionableStateItem, combineReducers, RenpyduxReducer
-from immer import Proxy
-from typing import Callable, Optional
+from typing import Callable, Optional, TypeVar
 from enum import Enum
 from dataclasses import dataclass, field
 import random
 import time
 
+T = TypeVar('T')
+
 
 class BattleActionType(Enum):
     ATTACK = "ATTACK"
@@ -14,7 +15,7 @@ class BattleActionType(Enum):
     DAMAGE = "DAMAGE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Character(RenpyduxState):
     name: str
     attack: int = 10
@@ -22,28 +23,37 @@ class Character(RenpyduxState):
     max_hp: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class BattleState(RenpyduxState):
     player: Character
     enemy: Character
     battle_log: list[str] = field(default_factory=lambda: ["BATTLE STARTED!"])
-    turn_count: int = 1,
+    turn_count: int = 1
     battle_over: bool = False
     winner: str = None
 
 
 def create_action(type: BattleActionType, payload: Optional[T] = None):
-    return ActionableStateItem(type.value, payload)
+    return ActionableStateItem(type, payload)
 
 # Helper functions for battle logic
+def _clamp_hp(hp: int, damage: int) -> int:
+    # Called on the undrafted store state; reads from an immer draft return a Proxy, not an int
+    new_hp = hp - damage
+    if new_hp < 0:
+        new_hp = 0
+    return new_hp
+
 def calculate_damage(attacker: Character, defender: Character):
     return max(0, attacker.attack - (defender.attack // 2))  # Simplified damage
 
-def is_alive(character: Character):
-    return character.hp > 0
+def create_damage_action(target: str, hp: int):
+  """ATTACK payload: the target ("player" or "enemy") and its hp after the hit, already clamped."""
+  return create_action(BattleActionType.ATTACK, {"target": target, "hp": hp})
 
-def create_damage_action(target: str, damage: int):
-  return create_action(BattleActionType.ATTACK, {"target": target, "damage": damage})
+def create_hp_action(hp: int):
+  """DAMAGE payload for character_reducer: the character's hp after the hit, already clamped."""
+  return create_action(BattleActionType.DAMAGE, {"hp": hp})
 
 def create_battle_log_action(log: str):
   return create_action(BattleActionType.LOG, {"log": log})
@@ -55,49 +65,44 @@ def character_reducer_builder_callback(builder: ActionReducerMapBuilder):
     def handle_damage(state: Character, action: ActionableStateItem):
         payload = action.payload
         if payload:
-            state.hp = max(0, state.hp - payload)
-    builder.add_case(create_action(BattleActionType.DAMAGE), handle_damage)
+            # The draft cannot be read, so the payload carries the clamped hp, see create_hp_action
+            state.hp = payload["hp"]
+    builder.add_case(BattleActionType.DAMAGE, handle_damage)
 
 def battle_reducer_builder_callback(builder):
     def handle_attack(state: Character, action: ActionableStateItem):
         payload = action.payload
         if payload:
+            # The draft only records writes, so the target's new hp comes from the payload
             target = payload["target"]
-            damage = payload["damage"]
+            hp = payload["hp"]
             if target == "player":
-                state.player.hp = max(0, state.player.hp - damage)
+                state.player.hp = hp
             elif target == "enemy":
-                state.enemy.hp = max(0, state.enemy.hp - damage)
+                state.enemy.hp = hp
 
-            # Check for battle end
-            if not is_alive(state.player):
+            # Check for battle end, only the side that was hit can fall
+            if hp <= 0:
                 state.battle_over = True
-                state.winner = "enemy"
-            elif not is_alive(state.enemy):
-                state.battle_over = True
-                state.winner = "player"
+                state.winner = "enemy" if target == "player" else "player"
             state.turn_count += 1
 
-    def handle_battle_log(state: BattleState, action: ActionableStateItem):
+    def handle_battle_log(battle_log: list[str], action: ActionableStateItem):
       payload = action.payload
       if payload:
-        log = payload["log"]
-        with Proxy(state.battle_log) as (_, new_battle_log):
-          _.append(log)
-          state.battle_log = new_battle_log
+        # Only the log slice is drafted, the append lands on a shallow copy of the list
+        battle_log.append(payload["log"])
 
     def handle_end_battle(state: BattleState, action: ActionableStateItem):
       payload = action.payload
       if payload:
         state.winner = payload["winner"]
-        with Proxy(state.battle_log) as (_, new_battle_log):
-            _.append(f"{payload["winner"]} wins!")
-            state.battle_log = new_battle_log
+        state.battle_log.append(f"{payload['winner']} wins!")
         state.battle_over = True
 
-    builder.add_case(create_action(BattleActionType.ATTACK), handle_attack)
-    builder.add_case(create_action(BattleActionType.LOG), handle_battle_log)
-    builder.add_case(create_action(BattleActionType.END), handle_end_battle)
+    builder.add_case(BattleActionType.ATTACK, handle_attack)
+    builder.add_case(BattleActionType.LOG, handle_battle_log, slice="battle_log")
+    builder.add_case(BattleActionType.END, handle_end_battle)
 
 initial_state = BattleState(
     player=Character(name="Hero", hp=100, attack=15, max_hp=100),
@@ -108,7 +113,7 @@ initial_state = BattleState(
     winner=None,
 )
 
-character_reducer = createReducer(initial_state.player, lambda state, action: state)
+character_reducer = createReducer(initial_state.player, character_reducer_builder_callback)
 
 battle_reducer = createReducer(initial_state, battle_reducer_builder_callback)
 # main_reducer = combineReducers({
@@ -130,15 +135,15 @@ def battle_turn():
 
     # Player's turn
     player_damage = calculate_damage(player, enemy)
-    store.dispatch(create_damage_action("enemy", player_damage))
-    store.dispatch(create_battle_log_action(f"{player.name} attacks {enemy.name} for {player_damage} damage."))
+    store.dispatch(create_damage_action("enemy", _clamp_hp(enemy.hp, player_damage)))
+    state = store.dispatch(create_battle_log_action(f"{player.name} attacks {enemy.name} for {player_damage} damage."))
 
-    if store.get_state().battle_over:
+    if state.battle_over:
       return
 
     # Enemy's turn
     enemy_damage = calculate_damage(enemy, player)
-    store.dispatch(create_damage_action("player", enemy_damage))
+    store.dispatch(create_damage_action("player", _clamp_hp(player.hp, enemy_damage)))
     store.dispatch(create_battle_log_action(f"{enemy.name} attacks {player.name} for {enemy_damage} damage."))
 
 def battle_loop():
@@ -147,10 +152,10 @@ def battle_loop():
         time.sleep(1)  # Simulate turn-based delay
 
     winner = store.get_state().winner
-    store.dispatch(create_battle_log_action(f"{store.get_state().winner} wins!"))
+    state = store.dispatch(create_battle_log_action(f"{winner} wins!"))
     print(f"Battle over! {winner} wins!")
     print("Battle Log:")
-    for log in store.get_state().battle_log:
+    for log in state.battle_log:
         print(log)
 
 # Run the battle
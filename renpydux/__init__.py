@@ -1,21 +1,28 @@
-import warnings
-from typing import Any, Callable, List, Set, Tuple, Generic, TypeVar, Optional, Union
+import sys
+from typing import Any, Callable, Iterable, List, Set, Tuple, Generic, TypeVar, Optional, Union
 from copy import deepcopy, copy
 from sebulvents.EventDispatcher import ValueDispatcher
-from dataclasses import dataclass
+from dataclasses import dataclass, is_dataclass
+from enum import Enum
 from immer import Proxy
+from immer.attr import has as attrs_has
 
 T = TypeVar('T')
 TState = TypeVar('TState', bound='RenpyduxState')
 
-@dataclass
+_MISSING = object()
+
+@dataclass(slots=True)
 class RenpyduxState:
     pass
 
 
 class ActionableStateItem(Generic[T]):
-    def __init__(self, type: str, payload: Optional[T]=None):
-        self.type = type
+    __slots__ = ("type", "payload")
+
+    def __init__(self, type: Union[str, Enum], payload: Optional[T]=None):
+        # Enum members are reduced to their value, string keys hash and compare faster
+        self.type = type.value if isinstance(type, Enum) else type
         self.payload = payload
 
 
@@ -24,21 +31,43 @@ class ActionReducerMapBuilder(Generic[T]):
         self.actions_map: dict[ActionableStateItem, Callable[[RenpyduxState, Optional[ActionableStateItem]], Any]] = {}
         self.matchers_map: dict[Callable[[ActionableStateItem], bool], Callable[[RenpyduxState, Optional[ActionableStateItem]], Any]] = {}
         self.default_reducer: Callable[[RenpyduxState, Optional[ActionableStateItem]], Any] = None
+        self.slices_map: dict[str, str] = {}
 
     def add_case(
         self,
-        action: ActionableStateItem,
-        reducer_action: Callable[[RenpyduxState, Optional[ActionableStateItem]], Any]
+        action: Union[str, Enum, ActionableStateItem],
+        reducer_action: Callable[[RenpyduxState, Optional[ActionableStateItem]], Any],
+        slice: Optional[str] = None
     ) -> 'ActionReducerMapBuilder':
+        """
+        Register a reducer for a single action type.
+        The action type can be given directly as a string or enum member,
+        so no action has to be built just to read its type.
+        When a slice is given, only that attribute of the state is proxied and
+        passed to the reducer as the draft, instead of the whole state.
+        The slice must hold a list, dict, set, dataclass or attrs instance, immer cannot
+        draft a scalar; createReducer rejects other slices when it is built.
+        """
         if len(self.matchers_map) > 0:
             raise Exception("add_case must be called before add_matcher")
         if self.default_reducer is not None:
             raise Exception("add_case must be called before set_default_reducer")
-        if not action.type:
+        if isinstance(action, Enum):
+            action_type = action.value
+        elif isinstance(action, ActionableStateItem):
+            action_type = action.type
+        else:
+            action_type = action
+        if not action_type:
             raise Exception("Action type is required")
-        if action.type in self.actions_map:
-            raise Exception(f"Action {action.type} already exists")
-        self.actions_map[action.type] = reducer_action
+        # Interned keys let dispatch lookups match on identity before comparing characters
+        if isinstance(action_type, str):
+            action_type = sys.intern(action_type)
+        if action_type in self.actions_map:
+            raise Exception(f"Action {action_type} already exists")
+        self.actions_map[action_type] = reducer_action
+        if slice is not None:
+            self.slices_map[action_type] = slice
         return self
 
     def add_matcher(
@@ -85,8 +114,8 @@ class RenpyduxStore(Generic[TState]):
             initial_state = initial_state()
         self.__state = initial_state if initial_state else reducer(None, None)
         self.__reducer = reducer
-        self.__event = ValueDispatcher[Tuple[Optional[TState], Optional[TState]]](self.__state)
-        self.__event.current = (initial_state, self.__state)
+        # Seeded with the initial pair directly, nothing can be subscribed yet so there is nothing to notify
+        self.__event = ValueDispatcher[Tuple[Optional[TState], Optional[TState]]]((initial_state, self.__state))
 
     def dispatch(self, action: ActionableStateItem):
         """
@@ -95,39 +124,72 @@ class RenpyduxStore(Generic[TState]):
         """
         old_state = self.__state
         self.__state = self.__reducer(self.__state, action)
-        self.__event.current = (self.__event.current[1], self.__state)
+        self.__event.current = (old_state, self.__state)
         return self.__state
 
+    def dispatch_batch(self, actions: Iterable[ActionableStateItem]):
+        """
+        Apply several actions in order as one state transition.
+        Subscribers are notified once with the state before the first action
+        and the state after the last one.
+        An empty batch leaves the state as is and notifies no one.
+        """
+        old_state = self.__state
+        state = old_state
+        reducer = self.__reducer
+        ran = False
+        for action in actions:
+            state = reducer(state, action)
+            ran = True
+        if not ran:
+            return state
+        self.__state = state
+        self.__event.current = (old_state, state)
+        return state
+
     def subscribe(self, handler: Callable[[Tuple[Optional[TState], Optional[TState]]], Any]) -> Callable[[], None]:
         return self.__event.subscribe(handler)
 
     def get_state(self) -> TState:
         """
-        Due to immer, we can return a shallow copy of the state.
-        We already have a deep copy of the state in the store.
+        Reducers always produce a new state through immer, so the stored state
+        is returned as is, without a copy.
+        The returned state must be treated as read-only and never mutated.
         """
-        return copy(self.__state)
+        return self.__state
 
 
 def combineReducers(slices: dict[str, RenpyduxReducer]):
+    # Resolved once here instead of on every dispatch
+    root = slices.get("root")
+    pairs = tuple((slice_name, reducer) for slice_name, reducer in slices.items() if slice_name != "root")
     def combined_reducer(state: RenpyduxState, action: ActionableStateItem):
         """
-        We will always use a deepcopy of the state to avoid mutation.
-        The reducer never has be passed in the old state.
+        Slice changes are collected and applied to a single shallow copy,
+        so the incoming state is never mutated or copied more than once.
         """
-        next_state = copy(state)
-        for slice_name, reducer in slices.items():
-            if slice_name == "root": continue
-            if not hasattr(next_state, slice_name): continue
-            sub_state = getattr(next_state, slice_name)
+        changes = {}
+        for slice_name, reducer in pairs:
+            sub_state = getattr(state, slice_name, _MISSING)
+            if sub_state is _MISSING: continue
             updated_sub_state = reducer(sub_state, action)
-            setattr(next_state, slice_name, updated_sub_state)
-        if slices.get("root"):
-            next_state = slices.get("root")(next_state, action)
+            if updated_sub_state is not sub_state:
+                changes[slice_name] = updated_sub_state
+        next_state = state
+        if changes:
+            # copy keeps init=False fields and works for attrs roots, unlike dataclasses.replace
+            next_state = copy(state)
+            for slice_name, updated_sub_state in changes.items():
+                setattr(next_state, slice_name, updated_sub_state)
+        if root:
+            next_state = root(next_state, action)
         return next_state
     return RenpyduxReducer(combined_reducer)
 
 
+def _is_draftable(value: Any) -> bool:
+    return isinstance(value, (list, dict, set)) or is_dataclass(value) or attrs_has(type(value))
+
 def __handleReducerBuilderCallback(callback: Callable[[ActionReducerMapBuilder], None]) -> ActionReducerMapBuilder:
     builder = ActionReducerMapBuilder()
     callback(builder)
@@ -139,21 +201,48 @@ def createReducer(
 ) -> RenpyduxReducer:
     if callable(initial_state): initial_state = initial_state()
     builder = __handleReducerBuilderCallback(builder_callback)
+    # Bind the builder's lookups once; the reducer runs on every dispatch.
+    # Each case resolves to (handler, slice) so a dispatch needs a single lookup.
+    slices_map = builder.slices_map
+    for action_type, slice_name in slices_map.items():
+        if initial_state is not None and not _is_draftable(getattr(initial_state, slice_name, None)):
+            raise Exception(f"Slice {slice_name} for action {action_type} must be a list, dict, set, dataclass or attrs instance")
+    cases_get = {action_type: (handler, slices_map.get(action_type)) for action_type, handler in builder.actions_map.items()}.get
+    matchers = tuple(builder.matchers_map.items())
+    default = builder.default_reducer
+    has_matchers = bool(matchers)
     def reducer(base_state: RenpyduxState = initial_state, action: Optional[ActionableStateItem]=None) -> RenpyduxState:
-        with Proxy(base_state) as (state, new_state):
-            if state is None:
-                raise Exception("State is required for reducers created from createReducer")
-            if action is None:
-                return new_state
-            if action.type in builder.actions_map:
-                builder.actions_map[action.type](state, action)
-                return new_state
-            for matcher, reducer_action in builder.matchers_map.items():
-                if matcher(action):
-                    reducer_action(state, action)
-            if builder.default_reducer is not None:
-                builder.default_reducer(state, action)
+        """
+        Only enters the immer Proxy when a case, matcher or default reducer will run.
+        Unhandled actions return the base state untouched.
+        """
+        if base_state is None:
+            base_state = initial_state
+        if base_state is None:
+            raise Exception("State is required for reducers created from createReducer")
+        if action is None:
+            return base_state
+        case = cases_get(action.type)
+        if case is not None:
+            handler, slice_name = case
+            if slice_name is not None:
+                # Only the annotated slice is walked by the proxy
+                with Proxy(getattr(base_state, slice_name)) as (sub_state, new_sub_state):
+                    handler(sub_state, action)
+                new_state = copy(base_state)
+                setattr(new_state, slice_name, new_sub_state)
                 return new_state
-        warnings.warn("No reducer found for action. Something seems terribly wrong. Do you have a default reducer?\n", action)
-        return base_state # Something bad happened
+            with Proxy(base_state) as (state, new_state):
+                handler(state, action)
+            return new_state
+        matched = [reducer_action for matcher, reducer_action in matchers if matcher(action)] if has_matchers else ()
+        if not matched and default is None:
+            # Normal under combineReducers, every slice sees every action
+            return base_state
+        with Proxy(base_state) as (state, new_state):
+            for reducer_action in matched:
+                reducer_action(state, action)
+            if default is not None:
+                default(state, action)
+        return new_state
     return RenpyduxReducer(reducer)
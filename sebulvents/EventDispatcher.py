@@ -1,4 +1,4 @@
-from typing import Callable, Set, Any, Generic, List, Optional, Set, Type, TypeVar, Union
+from typing import Callable, Any, Generic, Optional, Sequence, Tuple, Type, TypeVar, Union
 import types
 T = TypeVar('T')
 
@@ -7,29 +7,57 @@ TReturn = TypeVar('TReturn')
 TSetterValue = TypeVar('TSetterValue')
 TEventHandler = Union[Callable[[T], Any], Callable[[], Any]]
 
+class _Unsubscribe:
+    """Callable returned by subscribe, removes its handler when called."""
+    __slots__ = ("dispatcher", "handler")
+
+    def __init__(self, dispatcher: 'EventDispatcherBase', handler: TEventHandler):
+        self.dispatcher = dispatcher
+        self.handler = handler
+
+    def __call__(self) -> None:
+        self.dispatcher.unsubscribe(self.handler)
+
+
 class EventDispatcherBase(Generic[T]):
     def __init__(self):
-        self.__subscribers: Set[TEventHandler[T]] = set()
+        # Subscribers change rarely and are notified often, so they are kept
+        # in a tuple that is rebuilt on subscribe/unsubscribe.
+        self.__subscribers: Tuple[TEventHandler[T], ...] = ()
         self.subscribable: Subscribable[T] = Subscribable(self)
 
     def subscribe(self, handler: TEventHandler[T]) -> Callable[[], None]:
         """Subscribe to an event."""
-        self.__subscribers.add(handler)
-        return lambda: self.unsubscribe(handler)
+        self.subscribeNoToken(handler)
+        return _Unsubscribe(self, handler)
+
+    def subscribeNoToken(self, handler: TEventHandler[T]) -> None:
+        """Subscribe to an event without creating an unsubscribe callable."""
+        if handler not in self.__subscribers:
+            self.__subscribers = self.__subscribers + (handler,)
 
     def unsubscribe(self, handler: TEventHandler[T]) -> None:
         """Unsubscribe from an event."""
-        self.__subscribers.discard(handler)
+        # Equality rather than identity, bound methods are recreated on every access
+        self.__subscribers = tuple(h for h in self.__subscribers if h != handler)
+
+    def _hasSubscribers(self) -> bool:
+        """Whether a notify would reach any handler."""
+        return bool(self.__subscribers)
 
     def clear(self) -> None:
         """Clear all subscribers."""
-        self.__subscribers.clear()
+        self.__subscribers = ()
 
-    def notify(self, value: Optional[T] = None) -> List[Any]:
+    def notify(self, value: Optional[T] = None) -> Sequence[Any]:
         """Notify all subscribers with the given value."""
+        # The tuple is already a snapshot, handlers that (un)subscribe rebind the attribute
+        subscribers = self.__subscribers
+        if not subscribers:
+            return ()
         if value is not None:
-            return [handler(value) for handler in self.__subscribers] # type: ignore [call-arg]
-        return [handler() for handler in self.__subscribers] # type: ignore [call-arg]
+            return [handler(value) for handler in subscribers] # type: ignore [call-arg]
+        return [handler() for handler in subscribers] # type: ignore [call-arg]
 
 
 class Subscribable(Generic[T]):
@@ -48,24 +76,24 @@ class Subscribable(Generic[T]):
 class FlagDispatcher(EventDispatcherBase[None]):
     def __init__(self):
         super().__init__()
-        self.__flag: bool = False
+        # Protected so SignalContext.getter can read it without a method call
+        self._flag: bool = False
 
     def raiseFlag(self):
-        if(not self.__flag):
-            self.__flag = True
-            self.notify()
+        if(not self._flag):
+            self._flag = True
+            if self._hasSubscribers(): self.notify()
 
     def reset(self):
-        self.__flag = False
+        self._flag = False
 
     def isRaised(self):
-        return self.__flag
+        return self._flag
     
-    def subscribe(self, handler: TEventHandler[None]) -> Callable[[], None]:
-        unsubscribe = super().subscribe(handler)
-        if(self.__flag):
+    def subscribeNoToken(self, handler: TEventHandler[None]) -> None:
+        super().subscribeNoToken(handler)
+        if(self._flag):
             handler() # type: ignore [call-arg]
-        return unsubscribe
 
 
 class SubscribableValueEvent(Subscribable[T]):
@@ -93,7 +121,8 @@ class ValueDispatcher(EventDispatcherBase[T]):
     @current.setter
     def current(self, value: T):
         self.__value = value
-        self.notify(self.__value)
+        # Skip the notify call entirely while nobody is listening
+        if self._hasSubscribers(): self.notify(value)
 
     def subscribe(self, handler: TEventHandler[T], dispatch_immediately: bool = True) -> Callable[[], None]:
         unsubscribe = super().subscribe(handler)
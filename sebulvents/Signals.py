@@ -1,4 +1,4 @@
-from typing import Callable, Generic, Optional, Set, List, Any, TypeVar, Union, Protocol
+from typing import Callable, Generic, Optional, List, Any, TypeVar, Union, Protocol
 from .EventDispatcher import FlagDispatcher, Subscribable
 from enum import Enum
 
@@ -21,33 +21,37 @@ class MismatchedCollectionStackException(SignalException):
 class SignalSymbols(str, Enum):
     DEFAULT = "S@Signal__default__Enum"
 
-class DependencyContext:
-    CollectionSet: Set['DependencyContext'] = set()
-    CollectionStack: List['DependencyContext'] = []
+# Contexts currently collecting dependencies, innermost last.
+# Nesting stays shallow, so an identity scan is cheaper than keeping a set in sync.
+_COLLECTION_STACK: List['DependencyContext'] = []
 
+class DependencyContext:
     def __init__(self):
-        self._dependencies: Set[Subscribable] = set()
+        # Fan-out is small, a list scan is cheaper than hashing on every read
+        self._dependencies: List[Subscribable] = []
         self._event = FlagDispatcher()
         self._markDirty = lambda: self._event.raiseFlag()
 
     def _beginCollection(self) -> None:
-        if(self in DependencyContext.CollectionSet):
-            raise DangerousSignalDependencyException("Circular dependency detected")
-        DependencyContext.CollectionStack.append(self)
-        DependencyContext.CollectionSet.add(self)
+        for ctx in _COLLECTION_STACK:
+            if ctx is self:
+                raise DangerousSignalDependencyException("Circular dependency detected")
+        _COLLECTION_STACK.append(self)
 
     def _invoke(self, value: Any):
         pass
     
     def _collect(self) -> None:
-        if DependencyContext.CollectionStack == []: return None
-        sig = DependencyContext.CollectionStack[-1]
-        sig._dependencies.add(self._event.subscribable)
-        self._event.subscribe(sig._markDirty)
+        if not _COLLECTION_STACK: return None
+        sig = _COLLECTION_STACK[-1]
+        subscribable = self._event.subscribable
+        if subscribable not in sig._dependencies:
+            sig._dependencies.append(subscribable)
+        # The dependency list is what gets unsubscribed later, no token is needed
+        self._event.subscribeNoToken(sig._markDirty)
 
     def _endCollection(self) -> None:
-        DependencyContext.CollectionSet.discard(self)
-        if(DependencyContext.CollectionStack.pop() != self):
+        if(_COLLECTION_STACK.pop() is not self):
             raise MismatchedCollectionStackException("Mismatched collection stack")
         
     def _dispose(self) -> None:
@@ -136,7 +140,15 @@ class SignalContext(DependencyContext, Generic[TValue]):
         self._markDirty()
     
     def getter(self) -> TValue:
-        if self._event.isRaised() and callable(self._current):
+        event = self._event
+        if not event._flag:
+            # Clean signal, the common case between writes: nothing to recompute or reset
+            last = self._last
+            if last is None:
+                raise Exception("Signal failed to update its value. Currently set to {}".format(last))
+            if _COLLECTION_STACK: self._collect()
+            return last
+        if callable(self._current):
             self._clearDependencies()
             self._beginCollection()
             try:
@@ -144,7 +156,7 @@ class SignalContext(DependencyContext, Generic[TValue]):
             except SignalException as e:
                 print("Calculation for a signal is erroring: ", e)
             self._endCollection()
-        self._event.reset()
+        event.reset()
         self._collect()
         if self._last is None:
             raise Exception("Signal failed to update its value. Currently set to {}".format(self._last))
@@ -4,22 +4,22 @@ from immer import Proxy as ImmerProxy, produce
 from dataclasses import dataclass
 
 # --- Character and Enemy State ---
-@dataclass
+@dataclass(slots=True)
 class CharacterSlice:
     hp: int = 100
     attack: int = 10
 
-@dataclass
+@dataclass(slots=True)
 class EnemySlice:
     hp: int = 100
     attack: int = 8
 
-@dataclass
+@dataclass(slots=True)
 class GameSlice:
     turn: str = "player"
     game_over: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class OverarchingState:
     player: CharacterSlice
     enemy: EnemySlice
@@ -27,45 +27,71 @@ class OverarchingState:
 
 # --- Actions ---
 class PlayerAttack(ActionableStateItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("PLAYER_ATTACK", None)
 
 class EnemyAttack(ActionableStateItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("ENEMY_ATTACK", None)
 
 class EndTurn(ActionableStateItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("END_TURN", None)
 
 class CheckGameOver(ActionableStateItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("CHECK_GAME_OVER", None)
 
+class FastForward(ActionableStateItem):
+    __slots__ = ()
+
+    def __init__(self, player_hp: int, enemy_hp: int, turn: str):
+        super().__init__("FAST_FORWARD", {"player_hp": player_hp, "enemy_hp": enemy_hp, "turn": turn})
+
 # --- Reducers ---
+PLAYER_DAMAGE = 8
+ENEMY_DAMAGE = 8
+_GAME_ACTIONS = frozenset({"END_TURN", "CHECK_GAME_OVER", "FAST_FORWARD"})
+
 def character_reducer(state: CharacterSlice, action: ActionableStateItem):
+    if action.type != "ENEMY_ATTACK":
+        return state
     with ImmerProxy(state) as (draft_state, next_state):
-        if action.type == "ENEMY_ATTACK":
-            new_health = state.hp - 8
-            draft_state.hp = max(0, new_health)  # Enemy attack damage
+        new_health = state.hp - ENEMY_DAMAGE
+        draft_state.hp = max(0, new_health)  # Enemy attack damage
     return next_state
-    # return state
 
 def enemy_reducer(state: EnemySlice, action: ActionableStateItem):
+    if action.type != "PLAYER_ATTACK":
+        return state
     with ImmerProxy(state) as (draft_state, next_state):
-        if action.type == "PLAYER_ATTACK":
-            new_health = state.hp - 8  # Player attack damage
-            draft_state.hp = max(0, new_health)  # Player attack damage
+        new_health = state.hp - PLAYER_DAMAGE  # Player attack damage
+        draft_state.hp = max(0, new_health)  # Player attack damage
     return next_state
-    # return state
 
 def game_reducer(state: OverarchingState, action: ActionableStateItem):
+    if action.type not in _GAME_ACTIONS:
+        return state
     with ImmerProxy(state) as (draft_state, next_state):
         if action.type == "END_TURN":
             draft_state.game.turn = "enemy" if state.game.turn == "player" else "player"
         elif action.type == "CHECK_GAME_OVER":
             if state.enemy.hp <= 0 or state.player.hp <= 0:
                 draft_state.game.game_over = True
+        elif action.type == "FAST_FORWARD":
+            payload = action.payload
+            draft_state.player.hp = payload["player_hp"]
+            draft_state.enemy.hp = payload["enemy_hp"]
+            draft_state.game.turn = payload["turn"]
+            draft_state.game.game_over = True
     return next_state
 
 # --- Combine Reducers ---
@@ -80,7 +106,35 @@ initial_state = OverarchingState(CharacterSlice(), EnemySlice(), GameSlice())
 store = RenpyduxStore[OverarchingState](reducer, initial_state)
 
 # --- Simulation ---
-def turn_based_simulation():
+def _simulate(player_hp: int, enemy_hp: int, player_turn: bool) -> tuple[int, int, bool]:
+    # Same rules as the reducers above, on plain ints only
+    while player_hp > 0 and enemy_hp > 0:
+        if player_turn:
+            enemy_hp = max(0, enemy_hp - PLAYER_DAMAGE)
+        else:
+            player_hp = max(0, player_hp - ENEMY_DAMAGE)
+        player_turn = not player_turn
+    return player_hp, enemy_hp, player_turn
+
+def fast_forward(store: RenpyduxStore[OverarchingState]) -> OverarchingState:
+    """
+    Play the rest of the game without going through the reducers turn by turn.
+    Only the final state is dispatched, so subscribers are notified once.
+    """
+    state = store.get_state()
+    if state.game.game_over:
+        return state
+    player_hp, enemy_hp, player_turn = _simulate(state.player.hp, state.enemy.hp, state.game.turn == "player")
+    return store.dispatch(FastForward(player_hp, enemy_hp, "player" if player_turn else "enemy"))
+
+def turn_based_simulation(watch: bool = True):
+    """
+    Play the game turn by turn, printing each turn through a store listener.
+    Without watch nobody listens to the individual turns, so the game is fast forwarded instead.
+    """
+    if not watch:
+        return fast_forward(store)
+
     def listener(state_change):
         _, new_state = state_change
         if _.game.turn is not new_state.game.turn:
@@ -96,12 +150,8 @@ def turn_based_simulation():
     
     # Sample Turns
     while store.get_state().game.game_over == False:
-        if store.get_state().game.turn == "player":
-            store.dispatch(PlayerAttack())
-        else:    
-            store.dispatch(EnemyAttack())
-        store.dispatch(EndTurn())
-        store.dispatch(CheckGameOver())
+        attack = PlayerAttack() if store.get_state().game.turn == "player" else EnemyAttack()
+        store.dispatch_batch([attack, EndTurn(), CheckGameOver()])
         time.sleep(1)
     
 # Run the simulation